@@ -11,7 +11,6 @@ import os
 import re
 import sys
 import typing
-import xml.dom.minidom
 import xml.etree.ElementTree as ET
 
 from pathlib import (
@@ -33,6 +32,15 @@ EVAL_EXTRA_IGNORE_GEOMETRY = 'ignore_geometry'
 # mark unset values as 'not available'
 NOT_SET = 'n.a.'
 
+# bounding box encoded in file name
+# like '<name>_<x0>x<y0>_<x1>x<y1>.xml'
+BBOX_FILENAME_PATTERN = re.compile(r'.*_(\d{2,})x(\d{2,})_(\d{2,})x(\d{2,})')
+
+# groundtruth type encoded in file name
+# like '<name>.gt.<type>.xml' or '<name>.<type>.gt.xml'
+GT_TYPE_FILENAME_PATTERN = re.compile(r'.*gt.(\w{3,}).xml$')
+GT_TYPE_FILENAME_PATTERN_ALT = re.compile(r'.*\.(\w{3,})\.gt\.xml$')
+
 # how long evaluation shall take maximal
 # where "None" means "no timeout"
 EVAL_TIMEOUT = None
@@ -202,7 +210,7 @@ def get_bbox_data(file_path):
 
     # 1: inspect filename
     file_name = os.path.basename(file_path)
-    result = re.match(r'.*_(\d{2,})x(\d{2,})_(\d{2,})x(\d{2,})', file_name)
+    result = BBOX_FILENAME_PATTERN.match(file_name)
     if result:
         groups = result.groups()
         x0 = int(groups[0])
@@ -239,9 +247,9 @@ def get_bbox_data(file_path):
 
         elif 'PcGts' in start_token:
             # read from given page coordinates
-            doc_root = xml.dom.minidom.parse(file_path).documentElement
-            name_space = doc_root.namespaceURI
             root_element = ET.parse(file_path).getroot()
+            # PAGE revision namespace from root tag '{namespace}PcGts'
+            name_space = root_element.tag[1:].partition('}')[0]
             # step one: read PAGE border coords
             _xpr_page_borders = f'{{{name_space}}}Page/{{{name_space}}}Border/{{{name_space}}}Coords'
             _page_coords = root_element.findall(_xpr_page_borders)
@@ -289,11 +297,11 @@ def calculate_bounding_box(elements: typing.List[ET.Element], map_func) -> typin
 
 def _get_groundtruth_from_filename(file_path) -> str:
     _file_name = os.path.basename(file_path)
-    result = re.match(r'.*gt.(\w{3,}).xml$', _file_name)
+    result = GT_TYPE_FILENAME_PATTERN.match(_file_name)
     if result:
         return result[1]
     else:
-        alternative = re.match(r'.*\.(\w{3,})\.gt\.xml$', _file_name)
+        alternative = GT_TYPE_FILENAME_PATTERN_ALT.match(_file_name)
         if alternative:
             return alternative[1]
         else:
@@ -425,10 +433,14 @@ class Evaluator:
             n_executors = cpus // 2 if cpus > 3 else 1
             if self.verbosity == 1:
                 print(f"[DEBUG] use {n_executors} executors ({cpus}) to create evaluation data")
+            # hand entries over in chunks since each task pickles
+            # the bound method, i.e. this evaluator with all metrics
+            chunksize = max(1, len(entries) // (n_executors * 4))
             with concurrent.futures.ProcessPoolExecutor(max_workers=n_executors) as executor:
                 try:
                     _entries = list(
-                        executor.map(self._wrap_eval_entry, entries, timeout=EVAL_TIMEOUT))
+                        executor.map(self._wrap_eval_entry, entries,
+                                     timeout=EVAL_TIMEOUT, chunksize=chunksize))
                 except concurrent.futures.TimeoutError:
                     print(f"[ERROR] takes longer than {EVAL_TIMEOUT}s to evaluate {len(entries)} entries!")
                     sys.exit(1)
@@ -465,40 +477,49 @@ class Evaluator:
         # evaluate metric copies
         _current_metrics = []
 
-        for _m in self.metrics:
+        path_g = entry.path_g
+        path_c = entry.path_c
+
+        # read coordinate information (if any provided)
+        # to create frame for candidate data
+        coords = get_bbox_data(path_g)
+        if coords is not None and self.verbosity >= 2:
+            print(f"[TRACE] token coordinates {coords[0]}, {coords[1]}")
+
+        # if text mode is enforced
+        # forget groundtruth coordinates
+        coords = None if self.text_mode else coords
 
-            path_g = entry.path_g
-            path_c = entry.path_c
+        # metrics sharing same text function
+        # load groundtruth and candidate only once
+        _texts = {}
 
-            # read coordinate information (if any provided)
-            # to create frame for candidate data
-            coords = get_bbox_data(path_g)
-            if coords is not None and self.verbosity >= 2:
-                print(f"[TRACE] token coordinates {coords[0]}, {coords[1]}")
+        for _m in self.metrics:
 
             to_text_func = _m.to_text_func
 
-            # load ground-thruth text
-            (txt_gt, _) = to_text_func(path_g, oneliner=True)
+            if to_text_func not in _texts:
+                # load ground-thruth text
+                (txt_gt, _) = to_text_func(path_g, oneliner=True)
 
-            if not txt_gt:
-                print(f"[WARN ] groundtrooth '{path_g}' contains no text")
+                if not txt_gt:
+                    print(f"[WARN ] groundtrooth '{path_g}' contains no text")
 
-            # if text mode is enforced
-            # forget groundtruth coordinates
-            coords = None if self.text_mode else coords
+                # read candidate data as text
+                (txt_c, _) = to_text_func(path_c, coords, oneliner=True)
 
-            # read candidate data as text
-            (txt_c, _) = to_text_func(path_c, coords, oneliner=True)
+                if not txt_c:
+                    print(f"[WARN ] candidate '{path_c}' contains no text")
 
-            if not txt_c:
-                print(f"[WARN ] candidate '{path_c}' contains no text")
+                if self.verbosity >= 2:
+                    _label_ref = os.path.basename(path_g)
+                    _label_can = os.path.basename(path_c)
+                    print(f'[TRACE][{_label_ref}] RAW GROUNDTRUTH :: "{txt_gt}"')
+                    print(f'[TRACE][{_label_can}] RAW CANDIDATE   :: "{txt_c}"')
 
-            if self.verbosity >= 2:
-                _label_ref = os.path.basename(path_g)
-                _label_can = os.path.basename(path_c)
-                print(f'[TRACE][{_label_ref}] RAW GROUNDTRUTH :: "{txt_gt}"')
-                print(f'[TRACE][{_label_can}] RAW CANDIDATE   :: "{txt_c}"')
+                _texts[to_text_func] = (txt_gt, txt_c)
+
+            (txt_gt, txt_c) = _texts[to_text_func]
 
             _curr = copy.copy(_m)
             _curr.reference = txt_gt
@@ -12,12 +12,9 @@ import xml.dom.minidom
 
 import nltk
 import nltk.corpus as nltk_corp
-from nltk.metrics import precision as nltk_precision
-from nltk.metrics import (
-     recall,
-     f_measure
- )
+import numpy as np
 import rapidfuzz.distance.Levenshtein as rfls
+import rapidfuzz.process as rfp
 
 import digital_object as do
 
@@ -70,6 +67,8 @@ WHITESPACE_TRNSL = str.maketrans('', '', WHITESPACES)
 WHITESPACE_EXCL_BLANK_CHARS_TRNSL = str.maketrans('', '', WHITESPACES_EXCL_BLANK_CHARS)
 PUNCT_TRNSL = str.maketrans('', '', PUNCTUATIONS)
 DIGIT_TRNSL = str.maketrans('', '', DIGITS)
+# nonrelevant chars for dictionary metrics
+DICT_BAD_CHARS_TRNSL = str.maketrans('', '', '0123456789“„"\'?!*.;:-=[]()|')
 
 
 def _filter_whitespaces(a_str) -> str:
@@ -92,8 +91,8 @@ def _tokenize(a_str) -> typing.List[str]:
     return a_str.split() if isinstance(a_str, str) else a_str
 
 
-def _tokenize_to_sorted_set(a_str) -> typing.Set[str]:
-    return set(sorted(_tokenize(a_str)))
+def _tokenize_to_set(a_str) -> typing.Set[str]:
+    return set(_tokenize(a_str))
 
 
 #
@@ -111,25 +110,31 @@ NLTK_STOPWORDS = [
 STOPWORDS_DEFAULT = ['german', 'english', 'arabic', 'russian']
 
 
-def get_stopwords(nltk_mappings=None, languages=None) -> typing.Set[str]:
+def get_stopwords(nltk_mappings=None, languages=None) -> typing.FrozenSet[str]:
     """Helper Function to gather NLTK stopword data
     * ensure stopwords files are locally available
     * extract them as set
+
+    Stopwords are read only once for each combination
+    of mappings and languages, therefore immutable
     """
     if nltk_mappings is None:
         nltk_mappings = NLTK_STOPWORDS
+    if languages is None:
+        languages = STOPWORDS_DEFAULT
+    return _get_stopwords(tuple(nltk_mappings), tuple(languages))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_stopwords(nltk_mappings, languages) -> typing.FrozenSet[str]:
     try:
         for mapping in nltk_mappings:
             nltk_corp.stopwords.words(mapping)
     except LookupError:
         nltk.download('stopwords')
-    if languages is None:
-        languages = STOPWORDS_DEFAULT
-    _stopwords = {_all_words
-                  for _lang in languages
-                  for _all_words in nltk_corp.stopwords.words(_lang)
-                  }
-    return _stopwords
+    return frozenset(_all_words
+                     for _lang in languages
+                     for _all_words in nltk_corp.stopwords.words(_lang))
 
 
 def _strip_languages_stopwords(tokens, languages):
@@ -140,11 +145,18 @@ def _strip_stopwords_for(languages):
     return functools.partial(_strip_languages_stopwords, languages=languages)
 
 
+@functools.lru_cache(maxsize=32)
 def normalize_unicode(input_str: str, uc_norm_by=UC_NORMALIZATION_DEFAULT) -> str:
     """Apply basic unicode normalization
+
+    Pure ASCII is left as-is since it's invariant under
+    each normalization form. Only the few most recent
+    results are cached, since same entry's data gets
+    normalized for each metric, but keeping whole pages
+    of former entries alive doesn't pay off.
     """
 
-    if uc_norm_by is not None:
+    if uc_norm_by is not None and not input_str.isascii():
         input_str = unicodedata.normalize(uc_norm_by, input_str)
     return input_str
 
@@ -280,9 +292,7 @@ def _sanitize_chars(lines: typing.List[str]) -> typing.List[str]:
 
     sanitized: typing.List[str] = []
     for line in lines:
-        text = line.strip()
-        bad_chars = '0123456789“„"\'?!*.;:-=[]()|'
-        text = ''.join([c for c in text if c not in bad_chars])
+        text = line.strip().translate(DICT_BAD_CHARS_TRNSL)
         if '..' in text:
             text = text.replace('..', '')
         if '  ' in text:
@@ -383,6 +393,46 @@ class SimilarityMetric:
     def _forward(self):
         self._value = levenshtein_norm(self._data_reference, self._data_candidate)
 
+    @classmethod
+    def batch(cls, references, candidates, workers=1, **kwargs) -> np.ndarray:
+        """Evaluate i-th reference with i-th candidate
+        for all pairs at once and round with desired
+        precision afterwards, like value does for a
+        single pair
+
+        workers: number of threads used by batch
+        calculations (-1 means all available cores)
+        """
+        if len(references) != len(candidates):
+            raise DigitalEvalMetricException(
+                f"pairs mismatch: {len(references)} references vs. {len(candidates)} candidates!")
+        _metric = cls(**kwargs)
+        _refs = [_metric._prepare(_ref) for _ref in references]
+        _cans = [_metric._prepare(_can) for _can in candidates]
+        _values = _metric._forward_batch(_refs, _cans, workers) * 100
+        # round each like value, since np.round might differ
+        # from Python's round in the last digit
+        return np.array([round(_value, _metric.precision) for _value in _values.tolist()])
+
+    def _prepare(self, data):
+        data = normalize_unicode(data, self.unicode_normalization)
+        for _pre in self.preprocessings:
+            data = _pre(data)
+        return data
+
+    def _forward_batch(self, references, candidates, workers=1) -> np.ndarray:
+        return levenshtein_norm_pairs(references, candidates, workers=workers)
+
+    def _forward_each(self, references, candidates) -> np.ndarray:
+        """Fallback for metrics lacking batch calculation"""
+        _values = []
+        for _ref, _can in zip(references, candidates):
+            self._data_reference = _ref
+            self._data_candidate = _can
+            self._forward()
+            _values.append(self._value)
+        return np.array(_values, dtype=float)
+
 
 class MetricChars(SimilarityMetric):
     """Calculate plain sequent character based metric"""
@@ -468,6 +518,9 @@ class MetricDictionaryLangTool(MetricDictionary):
         typo_errors = len(total_matches)
         self.diff = typo_errors if typo_errors <= num_words else num_words
 
+    def _forward_batch(self, references, candidates, workers=1) -> np.ndarray:
+        raise DigitalEvalMetricException(f"{self.label} doesn't support batch evaluation!")
+
 
 class MetricBoW(SimilarityMetric):
     """Calculate metric for a multiset of word tokens"""
@@ -484,6 +537,9 @@ class MetricBoW(SimilarityMetric):
     def _forward(self):
         self._value = bag_of_tokens(self._data_reference, self._data_candidate)
 
+    def _forward_batch(self, references, candidates, workers=1) -> np.ndarray:
+        return self._forward_each(references, candidates)
+
 
 class MetricIR(SimilarityMetric):
     """Calculate information retrival metrics"""
@@ -495,16 +551,19 @@ class MetricIR(SimilarityMetric):
             normalization,
             preprocessings)
         self.languages = languages
-        self.preprocessings = [_tokenize_to_sorted_set,
+        self.preprocessings = [_tokenize_to_set,
                                _strip_stopwords_for(self.languages)
                                ]
-        # no aligning required, we rely on nltk
+        # no aligning required, only set operations
         self.calc_func = None
 
     def _forward(self):
         """to remind that this class needs further refinement"""
         raise NotImplementedError
 
+    def _forward_batch(self, references, candidates, workers=1) -> np.ndarray:
+        return self._forward_each(references, candidates)
+
 
 class MetricIRPre(MetricIR):
     """Calculate precision"""
@@ -554,7 +613,7 @@ class MetricIRFM(MetricIR):
         self._value = ir_fmeasure(self._data_reference, self._data_candidate)
 
 
-def levenshtein_norm(reference_data, candidate_data, inverse=False) -> int:
+def levenshtein_norm(reference_data, candidate_data, inverse=False, score_cutoff=None) -> int:
     """Calculate levenshtein metric as ration of sum of edit operations 
     normalized to sum of edit and equal operations.
 
@@ -563,54 +622,128 @@ def levenshtein_norm(reference_data, candidate_data, inverse=False) -> int:
     * abbreviations  (like "Nr." or "Etg.")
     * numbers/years  (like "1899")
     * split-up words (line endings/beginnings)
+
+    score_cutoff: optional threshold to stop calculation early
+    if similarity falls below (or distance, if inverse, exceeds)
+    it, which then yields 0.0 (or 1.0, if inverse)
     """
+    # trivial cases: identical or at least one empty input
+    if reference_data == candidate_data:
+        return 0.0 if inverse else 1.0
+    if not reference_data or not candidate_data:
+        return 1.0 if inverse else 0.0
     if inverse:
-        return rfls.normalized_distance(reference_data, candidate_data)
-    return rfls.normalized_similarity(reference_data, candidate_data)
+        return rfls.normalized_distance(reference_data, candidate_data, score_cutoff=score_cutoff)
+    return rfls.normalized_similarity(reference_data, candidate_data, score_cutoff=score_cutoff)
 
 
-def bag_of_tokens(reference_tokens: typing.List[str],
-                  candidate_tokens: typing.List[str]) -> int:
+def levenshtein_norm_pairs(references, candidates, inverse=False, workers=1) -> np.ndarray:
+    """Calculate levenshtein metric like levenshtein_norm for each
+    pair of reference and candidate at once, i.e. the i-th reference
+    with the i-th candidate, within a single rapidfuzz call
+
+    workers: number of threads to use (-1 means all available cores)
+    """
+    if len(references) != len(candidates):
+        raise DigitalEvalMetricException(
+            f"pairs mismatch: {len(references)} references vs. {len(candidates)} candidates!")
+    scorer = rfls.normalized_distance if inverse else rfls.normalized_similarity
+    return rfp.cpdist(references, candidates, scorer=scorer, workers=workers, dtype=np.float64)
+
+
+def levenshtein_norm_matrix(references, candidates, inverse=False, workers=1) -> np.ndarray:
+    """Calculate levenshtein metric like levenshtein_norm for each
+    reference against each candidate within a single rapidfuzz call,
+    with references as rows and candidates as columns
+
+    workers: number of threads to use (-1 means all available cores)
+    """
+    scorer = rfls.normalized_distance if inverse else rfls.normalized_similarity
+    return rfp.cdist(references, candidates, scorer=scorer, workers=workers, dtype=np.float64)
+
+
+def bag_of_tokens(reference_tokens: typing.Union[typing.List[str], typing.Counter[str]],
+                  candidate_tokens: typing.Union[typing.List[str], typing.Counter[str]]) -> int:
     """Calculate difference between reference and candidate token list
+
+    Both token lists might as well be passed as prepared
+    collections.Counter, i.e. to count a reference only
+    once when comparing it against many candidates
     """
-    false_negatives: typing.List[str] = _diff(reference_tokens, candidate_tokens)
-    false_positives: typing.List[str] = _diff(candidate_tokens, reference_tokens)
-    delta = len(false_negatives) + len(false_positives)
-    total = len(reference_tokens) + len(candidate_tokens)
-    subtrahend = (delta / total) if total > 0 else 0
-    ratio = 1 - subtrahend
+    _ref_bag = _to_bag(reference_tokens)
+    _can_bag = _to_bag(candidate_tokens)
+    total = sum(_ref_bag.values()) + sum(_can_bag.values())
+    if total == 0:
+        return 1.0
+    # false negatives plus false positives equal total minus twice
+    # the multiset intersection, so a single C-level Counter '&' will do
+    _common = _ref_bag & _can_bag
+    delta = total - 2 * sum(_common.values())
+    ratio = 1 - (delta / total)
     return ratio
 
 
-def _diff(gt_tokens, cd_tokens) -> typing.List[str]:
-    return list((collections.Counter(gt_tokens) - collections.Counter(cd_tokens)).elements())
+def bag_of_tokens_batch(reference_tokens: typing.List[str],
+                        candidates: typing.List[typing.List[str]]) -> np.ndarray:
+    """Calculate bag_of_tokens of one reference against
+    many candidate token lists at once
+
+    Reference gets counted only once into a frequency vector,
+    candidates only with respect to the reference vocabulary,
+    since any other token can't be a hit
+    """
+    _vocabulary = {}
+    _ref_ids = np.array([_vocabulary.setdefault(t, len(_vocabulary)) for t in reference_tokens],
+                        dtype=np.intp)
+    _ref_freqs = np.bincount(_ref_ids, minlength=len(_vocabulary))
+    ratios = np.ones(len(candidates))
+    for i, _tokens in enumerate(candidates):
+        total = len(reference_tokens) + len(_tokens)
+        if total == 0:
+            continue
+        _ids = np.array([_vocabulary[t] for t in _tokens if t in _vocabulary], dtype=np.intp)
+        n_hits = int(np.minimum(_ref_freqs, np.bincount(_ids, minlength=len(_vocabulary))).sum())
+        # same arithmetics as bag_of_tokens for identical floats
+        ratios[i] = 1 - ((total - 2 * n_hits) / total)
+    return ratios
+
+
+def _to_bag(tokens) -> typing.Counter[str]:
+    return tokens if isinstance(tokens, collections.Counter) else collections.Counter(tokens)
+
+
+def ir_scores(reference_data, candidate_data) -> typing.Tuple[float, float, float]:
+    """Calculate Precision, Recall and F-Measure at once
+    from the intersection of reference and candidate tokens
+
+    Like nltk, but reports 0.0 for each score that is undefined
+    because of empty data or no tokens recalled at all
+    """
+
+    n_hits = len(reference_data & candidate_data)
+    _prec = n_hits / len(candidate_data) if candidate_data else 0.0
+    _rec = n_hits / len(reference_data) if reference_data else 0.0
+    # harmonic mean 2PR/(P+R) simplifies to 2|A∩B|/(|A|+|B|)
+    _fm = 2 * n_hits / (len(reference_data) + len(candidate_data)) if n_hits else 0.0
+    return _prec, _rec, _fm
 
 
 def ir_precision(reference_data, candidate_data) -> float:
     """Calculate Precision for given languages"""
 
-    _prec = nltk_precision(reference_data, candidate_data)
-    # nltk actually handles this inconsistently ...
-    if _prec is None:
-        _prec = 0.0
-    return _prec
+    return ir_scores(reference_data, candidate_data)[0]
 
 
 def ir_recall(reference_data, candidate_data) -> float:
     """Calculate Recall for given languages"""
 
-    # here nltk reports 0.0 if nothing recalled
-    return recall(reference_data, candidate_data)
+    return ir_scores(reference_data, candidate_data)[1]
 
 
 def ir_fmeasure(reference_data, candidate_data) -> float:
     """Calculate F-Measure for given languages"""
 
-    _fm = f_measure(reference_data, candidate_data)
-    # required since nltk actually handles this inconsistently ...
-    if _fm is None:
-        _fm = 0.0
-    return _fm
+    return ir_scores(reference_data, candidate_data)[2]
 
 
 # diacritica to take care of
@@ -3,6 +3,7 @@
 
 import random
 
+import numpy as np
 import pytest
 
 import digital_eval.metrics as digem
@@ -179,17 +180,18 @@ def test_metric_character_accuracy():
     assert 92.31 == pytest.approx(char_metric.value, rel=0.001, abs=0.001)
 
 
-def test_metric_bot_ident():
-    """BOW with identical tokens"""
+BOT_IDENT_TOKENS = "the lazy brown fox jumps over the hump again and again three times the dude".split()
+BOT_IDENT_SHUFFLES = [tuple(random.Random(seed).sample(BOT_IDENT_TOKENS, len(BOT_IDENT_TOKENS)))
+                      for seed in range(4)]
+
 
-    gt1 = "the lazy brown fox jumps over the hump again and again three times the dude"
-    list2 = list(gt1.split())
-    random.shuffle(list2)
-    str2 = ' '.join(list2)
+@pytest.mark.parametrize("shuffled", BOT_IDENT_SHUFFLES)
+def test_metric_bot_ident(shuffled):
+    """BOW with identical tokens"""
 
-    result = digem.bag_of_tokens(gt1.split(), str2.split())
+    result = digem.bag_of_tokens(BOT_IDENT_TOKENS, list(shuffled))
     assert result == 1.0
-    assert len(gt1.split()) == len(str2.split())
+    assert len(BOT_IDENT_TOKENS) == len(shuffled)
 
 
 def test_metric_bot_candidate_with_only_repetitions():
@@ -376,6 +378,62 @@ def test_metrics_token_based_more_gt_than_tc():
     assert len(cand) + 3 == len(gt1)
 
 
+def test_metric_chars_batch():
+    """Batch evaluation of character metric
+    matches evaluation of each single pair"""
+
+    # arrange
+    references = [THE_LAZY_FOX, 'sthe lazy brown fox jumps overthe hump', '']
+    candidates = [THE_COMBINED_A_FOX, 'fthe lazy brown fox jumps ouer the hump', THE_LAZY_FOX]
+
+    # act
+    values = digem.MetricChars.batch(references, candidates)
+
+    # assert
+    assert values.tolist() == [95.0, 92.31, 0.0]
+
+
+def test_metric_bow_batch():
+    """Batch evaluation also works for metrics
+    without a batch calculation of their own"""
+
+    # arrange
+    references = [THE_LAZY_FOX, "der Mann steht an der Ampel"]
+    candidates = [THE_FOX_LAZY, "cer Mann fteht an der Ampel"]
+
+    # act
+    values = digem.MetricBoW.batch(references, candidates)
+
+    # assert
+    assert values.tolist()[0] == 100.0
+    assert 66.66 == pytest.approx(values.tolist()[1], rel=1e-2)
+
+
+def test_metric_words_batch_from_arrays_multithreaded():
+    """Batch evaluation accepts numpy arrays
+    and may use all available cores"""
+
+    # arrange
+    references = np.array([THE_LAZY_FOX] * 8, dtype=object)
+    candidates = np.array([THE_FOX_LAZY] * 4 + [THE_LAZY_FOX] * 4, dtype=object)
+
+    # act
+    values = digem.MetricWords.batch(references, candidates, workers=-1)
+
+    # assert
+    assert values.tolist() == [75.0] * 4 + [100.0] * 4
+
+
+def test_metric_dict_langtool_batch_unsupported():
+    """LanguageTool metric yields no similarity
+    for a pair, therefore no batch evaluation"""
+
+    with pytest.raises(digem.DigitalEvalMetricException) as err:
+        digem.MetricDictionaryLangTool.batch([THE_LAZY_FOX], [THE_FOX_LAZY])
+
+    assert 'DictLT' in err.value.args[0]
+
+
 
 ########################################################### OCR-Pipeline-Tests
 
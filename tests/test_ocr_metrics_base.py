@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """OCR Metric Test Module"""
 
+import collections
 import random
 
 import pytest
@@ -76,17 +77,18 @@ def test_metric_calculate_character_edit_distance():
     assert 0.923 == pytest.approx(distance, 1e-4)
 
 
-def test_metric_bot_ident():
-    """BOW with identical tokens"""
+BOT_IDENT_TOKENS = "the lazy brown fox jumps over the hump again and again three times the dude".split()
+BOT_IDENT_SHUFFLES = [tuple(random.Random(seed).sample(BOT_IDENT_TOKENS, len(BOT_IDENT_TOKENS)))
+                      for seed in range(4)]
+
 
-    gt1 = "the lazy brown fox jumps over the hump again and again three times the dude"
-    list2 = list(gt1.split())
-    random.shuffle(list2)
-    str2 = ' '.join(list2)
+@pytest.mark.parametrize("shuffled", BOT_IDENT_SHUFFLES)
+def test_metric_bot_ident(shuffled):
+    """BOW with identical tokens"""
 
-    similarity = digem.bag_of_tokens(gt1.split(), str2.split())
+    similarity = digem.bag_of_tokens(BOT_IDENT_TOKENS, list(shuffled))
     assert similarity == 1.0
-    assert len(gt1.split()) == len(str2.split())
+    assert len(BOT_IDENT_TOKENS) == len(shuffled)
 
 
 def test_metric_bot_candidate_with_only_repetitions():
@@ -111,6 +113,44 @@ def test_metric_bot_miss_tokens():
     assert 0.66 == pytest.approx(digem.bag_of_tokens(gt1.split(), str2.split()), abs=1e-2)
 
 
+def test_metric_bot_prepared_reference():
+    """BOW with reference tokens counted only once
+    for different candidates"""
+
+    # arrange
+    gt1 = collections.Counter("the lazy brown fox jumps".split())
+    candidates = ["the brown fux jumps", "the lazy brown fox jumps"]
+
+    # act
+    similarities = [digem.bag_of_tokens(gt1, c.split()) for c in candidates]
+
+    # assert
+    assert similarities == [digem.bag_of_tokens("the lazy brown fox jumps".split(), c.split())
+                            for c in candidates]
+    assert similarities[1] == 1.0
+
+
+def test_metric_bot_batch_like_single_pairs():
+    """BOW of one reference against many candidates
+    yields same results as each single pair"""
+
+    # arrange
+    gt1 = "the dizzy brown fox jumps".split()
+    candidates = ["the dizzy brown fox fox fox jumps".split(),
+                  "the brown fux jumps".split(),
+                  "the dizzy brown fox leaps over humps".split(),
+                  "völlig andere wörter".split(),
+                  gt1,
+                  []]
+
+    # act
+    similarities = digem.bag_of_tokens_batch(gt1, candidates)
+
+    # assert
+    assert similarities.tolist() == [digem.bag_of_tokens(gt1, c) for c in candidates]
+    assert digem.bag_of_tokens_batch([], [[]]).tolist() == [1.0]
+
+
 def test_metrics_token_based_more_gt_than_tc():
     """token edit distance with
     * 2 exchanges (first 2 tokens), followed by
@@ -163,3 +203,110 @@ def test_metrics_token_based_no_test_candidate():
 
     # assert
     assert diff == 1.0
+
+
+@pytest.mark.parametrize("reference,candidate,similarity",
+                         [(THE_LAZY_FOX, THE_LAZY_FOX, 1.0),
+                          (THE_LAZY_FOX, '', 0.0),
+                          ('', THE_LAZY_FOX, 0.0),
+                          ('', '', 1.0),
+                          ([], [], 1.0)])
+def test_metrics_trivial_inputs(reference, candidate, similarity):
+    """Identical or empty inputs yield same
+    results as rapidfuzz, in both directions"""
+
+    assert similarity == digem.levenshtein_norm(reference, candidate)
+    assert 1.0 - similarity == digem.levenshtein_norm(reference, candidate, inverse=True)
+
+
+def test_metrics_score_cutoff():
+    """Early exit with score_cutoff yields worst value
+    only if threshold not reached, in both directions"""
+
+    # act
+    similarity = digem.levenshtein_norm(THE_LAZY_FOX, THE_FOX_LAZY)
+    cut_similarity = digem.levenshtein_norm(THE_LAZY_FOX, THE_FOX_LAZY, score_cutoff=0.9)
+    cut_distance = digem.levenshtein_norm(THE_LAZY_FOX, THE_FOX_LAZY, inverse=True, score_cutoff=0.1)
+
+    # assert
+    assert similarity == digem.levenshtein_norm(THE_LAZY_FOX, THE_FOX_LAZY, score_cutoff=0.5)
+    assert cut_similarity == 0.0
+    assert cut_distance == 1.0
+
+
+def test_metrics_pairs_like_single_pairs():
+    """Pairwise calculation yields same similarities
+    as calculating each pair on its own, both for
+    characters and tokens"""
+
+    # arrange
+    references = [THE_LAZY_FOX, THE_LAZY_FOX, '', 'abc']
+    candidates = [THE_FOX_LAZY, THE_LAZY_FOX, '', 'abd']
+
+    # act
+    similarities = digem.levenshtein_norm_pairs(references, candidates)
+    token_similarities = digem.levenshtein_norm_pairs([r.split() for r in references],
+                                                      [c.split() for c in candidates])
+
+    # assert
+    assert len(similarities) == 4
+    for i, (ref, can) in enumerate(zip(references, candidates)):
+        assert similarities.tolist()[i] == digem.levenshtein_norm(ref, can)
+        assert token_similarities.tolist()[i] == digem.levenshtein_norm(ref.split(), can.split())
+
+
+def test_metrics_pairs_mismatch():
+    """Pairs require same number of references and candidates"""
+
+    with pytest.raises(digem.DigitalEvalMetricException) as err:
+        digem.levenshtein_norm_pairs([THE_LAZY_FOX], [])
+
+    assert 'pairs mismatch' in err.value.args[0]
+
+
+def test_metrics_matrix_like_single_pairs():
+    """Each reference against each candidate yields
+    same similarities as calculating each pair on its own"""
+
+    # arrange
+    references = [THE_LAZY_FOX, THE_COMBINED_A_FOX]
+    candidates = [THE_FOX_LAZY, THE_LAZY_FOX, 'the']
+
+    # act
+    similarities = digem.levenshtein_norm_matrix(references, candidates)
+    distances = digem.levenshtein_norm_matrix(references, candidates, inverse=True, workers=-1)
+
+    # assert
+    assert similarities.shape == (2, 3)
+    assert similarities.tolist() == [[digem.levenshtein_norm(ref, can) for can in candidates]
+                                     for ref in references]
+    assert distances.tolist() == [[digem.levenshtein_norm(ref, can, inverse=True) for can in candidates]
+                                  for ref in references]
+
+
+def test_metrics_ir_scores_at_once():
+    """Precision, Recall and F-Measure from
+    a single intersection of token sets"""
+
+    # arrange
+    reference = {'brown', 'fox', 'jumps', 'lazy', 'hump'}
+    candidate = {'red', 'fox'}
+
+    # act
+    prec, rec, fm = digem.ir_scores(reference, candidate)
+
+    # assert
+    assert prec == 0.5
+    assert rec == 0.2
+    assert 0.2857 == pytest.approx(fm, rel=1e-3)
+    assert (prec, rec, fm) == (digem.ir_precision(reference, candidate),
+                               digem.ir_recall(reference, candidate),
+                               digem.ir_fmeasure(reference, candidate))
+
+
+def test_metrics_ir_scores_empty_data():
+    """Undefined scores are reported as 0.0"""
+
+    assert (0.0, 0.0, 0.0) == digem.ir_scores(set(), {'fox'})
+    assert (0.0, 0.0, 0.0) == digem.ir_scores({'fox'}, set())
+    assert (0.0, 0.0, 0.0) == digem.ir_scores(set(), set())